@@ -164,6 +164,10 @@ class ParameterSet:
 
         self.__dict__.update(kwargs)
 
+        # tangents of the half opening angles (precomputed after the update, so they follow a given GAMMA_T / GAMMA_R)
+        self.TAN_HALF_GAMMA_T = math.tan(self.GAMMA_T / 2)
+        self.TAN_HALF_GAMMA_R = math.tan(self.GAMMA_R / 2)
+
 
 def get_integral_dict(p: ParameterSet) -> Dict:
 
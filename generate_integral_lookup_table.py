@@ -2,20 +2,25 @@ __author__  = "Martin Hahner"
 __contact__ = "martin.hahner@pm.me"
 __license__ = "CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)"
 
+import copy
 import pickle
 import argparse
-import functools
 
+import numba
 import numpy as np
 import multiprocessing as mp
 
 from tqdm import tqdm
-from typing import List
+from typing import List, Tuple
 from pathlib import Path
 from theory import ParameterSet, P_R_fog_soft
 
 from scipy.constants import speed_of_light as c     # in m/s
 
+# set in every worker process by init_worker()
+P = None
+SHIFT = True
+
 
 
 def parse_arguments():
@@ -41,12 +46,50 @@ def parse_arguments():
     return arguments
 
 
-def P_R_fog_soft_wrapper(p, R: float, n: int = None) -> float:
+def P_R_fog_soft_wrapper(p, R: np.ndarray) -> np.ndarray:
+
+    y = np.zeros(R.shape)
+
+    mask = R <= p.r_0   # skip unnecessary computation
+    y[mask] = P_R_fog_soft(p, R[mask])
+
+    return y
+
+
+def init_worker(p: ParameterSet, shift: bool) -> None:
+
+    # the parameter set is sent to each worker once instead of with every R_0
+
+    global P, SHIFT
+
+    P = p
+    SHIFT = shift
+
+    # every worker already runs on its own CPU
+    numba.set_num_threads(1)
+
+
+def fog_peak(r_0: float) -> Tuple[float, float]:
 
-    if R > p.r_0:
-        return 0            # skip unnecessary computation
-    else:
-        return P_R_fog_soft(p, R, n)
+    p = copy.copy(P)
+    p.r_0 = r_0
+
+    x_list = np.linspace(0, p.r_range, p.n)
+    y_list = P_R_fog_soft_wrapper(p, x_list)
+
+    if SHIFT:
+        # shift x so that the peak of the transmitted pulse is at t=0
+        # and the peak response of the hard target is at R_0
+        x_list = x_list - p.tau_h * c / 2
+
+    argmax = np.argmax(y_list)
+
+    fog_distance = x_list[argmax]
+    fog_response = y_list[argmax]
+
+    fog_integral = fog_response / (p.c_a * p.p_0 * p.beta)
+
+    return fog_distance, fog_integral
 
 
 def generate_integral_lookup_tables(arguments) -> None:
@@ -57,7 +100,6 @@ def generate_integral_lookup_tables(arguments) -> None:
         r_0_max = arguments.r_0_max
 
         save_path = Path(arguments.save_path)
-        pool = mp.Pool(arguments.n_cpus)
         granularity = r_0_max / n
 
         filename = f'integral_0m_to_{r_0_max}m_stepsize_{granularity}m_tau_h_20ns_alpha_{alpha}.pickle'
@@ -67,33 +109,19 @@ def generate_integral_lookup_tables(arguments) -> None:
 
         p = ParameterSet(n=n, r_range=r_0_max, alpha=alpha)
 
-        integral = {}
-        r_0 = 0
-
         steps = int(r_0_max / granularity)
 
-        for _ in tqdm(range(steps + 1)):
-
-            p.r_0 = round(r_0, 2)
-
-            x_list = np.linspace(0, p.r_range, p.n)
-            y_list = pool.map(functools.partial(P_R_fog_soft_wrapper, p), x_list)
-
-            if arguments.shift:
-                # shift x so that the peak of the transmitted pulse is at t=0
-                # and the peak response of the hard target is at R_0
-                x_list = x_list - p.tau_h * c / 2
-
-            argmax = np.argmax(y_list)
+        r_zeros = [round(step * granularity, 2) for step in range(steps + 1)]
 
-            fog_distance = x_list[argmax]
-            fog_response = y_list[argmax]
+        # batch several R_0 per task, but keep enough tasks for a smooth progress bar
+        chunksize = max(1, len(r_zeros) // (10 * arguments.n_cpus))
 
-            fog_integral = fog_response / (p.c_a * p.p_0 * p.beta)
+        # each range grid is evaluated in one vectorized call, so parallelize over R_0 instead
+        with mp.Pool(arguments.n_cpus, initializer=init_worker, initargs=(p, arguments.shift)) as pool:
 
-            integral[p.r_0] = (fog_distance, fog_integral)
+            fog_peaks = list(tqdm(pool.imap(fog_peak, r_zeros, chunksize=chunksize), total=len(r_zeros)))
 
-            r_0 += granularity
+        integral = dict(zip(r_zeros, fog_peaks))
 
         with open(filepath, 'wb') as f:
             pickle.dump(integral, f, protocol=pickle.HIGHEST_PROTOCOL)
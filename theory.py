@@ -9,28 +9,57 @@ __license__ = "CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)"
 import sys
 import math
 import socket
-import functools
 
 import numpy as np
 import matplotlib as plt
-import multiprocessing as mp
 import matplotlib.patches as mpatches
-import scipy.integrate as scipy_integrate
 
+from typing import Tuple
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from PyQt5.QtWidgets import *
 from matplotlib.figure import Figure
+from theory_kernels import Params
 from fog_simulation import ParameterSet
 from matplotlib.backends.backend_qt5agg import (FigureCanvas, NavigationToolbar2QT as NavigationToolbar)
 
 from scipy.constants import speed_of_light as c     # in m/s
 
+try:  # compiled ahead of time by running theory_kernels.py
+    from theory_kernels_aot import xsi, integral
+except ImportError:
+    from theory_kernels import xsi, integral
+
 SUB = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
 SUP = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
 
 TAU_H = '\u03C4' + '\N{LATIN SUBSCRIPT SMALL LETTER H}'
 
+# one row per slider (name, title, parameter, label text) or info label in between (name, None, None, label text)
+ROW_SPECS = [('r', 'range', 'r_range', lambda p: f"r = {p.r_range}"),
+             ('n', 'quantization', 'n', lambda p: f"n = {p.n}"),
+             ('mor', None, None, lambda p: f'meteorological optical range (MOR) = {round(p.mor, 2)}m'),
+             ('alpha', 'attenuation coefficient', 'alpha', lambda p: f"\u03B1 = {p.alpha}"),
+             ('beta', 'backscattering coefficient', 'beta', lambda p: f"\u03B2 = {round(p.beta * p.mor, 3)} / MOR"),
+             ('e_p', None, None, lambda p: f'total pulse energy (E\N{LATIN SUBSCRIPT SMALL LETTER P}) = '
+                                           f'{round(p.e_p * 1e6, 1)} \u03BCJ'),
+             ('p_0', 'pulse peak power', 'p_0', lambda p: 'P0'.translate(SUB) + f" = {p.p_0} W"),
+             ('tau_h', 'half-power pulse width', 'tau_h', lambda p: f"{TAU_H} = {int(p.tau_h * p.tau_h_scale)} ns"),
+             ('c_a', None, None, lambda p: f'system constant (C\N{LATIN SUBSCRIPT SMALL LETTER A}) = {round(p.c_a)}'),
+             ('a_r', 'aperture area of the receiver', 'a_r', lambda p: f"A\N{LATIN SUBSCRIPT SMALL LETTER R} = {p.a_r} m²"),
+             ('l_r', "loss of the receiver's optics", 'l_r',
+              lambda p: f"L\N{LATIN SUBSCRIPT SMALL LETTER R} = {int(p.l_r * p.l_r_scale)} %"),
+             ('optics', None, None, lambda p: 'sensor optics'),
+             ('r_1', "", 'r_1', lambda p: 'R1'.translate(SUB) + f" = {p.r_1} m"),
+             ('r_2', "", 'r_2', lambda p: 'R2'.translate(SUB) + f" = {p.r_2} m"),
+             ('beta_0', None, None, lambda p: f'differential reflextivity of the hard target (\u03B2' +
+                                              '0)'.translate(SUB) + f' = {round(p.beta_0, 5)}'),
+             ('r_0', "distance to the hard target", 'r_0', lambda p: 'R0'.translate(SUB) + f" = {p.r_0} m"),
+             ('gamma', "reflextivity of the hard target", 'gamma', lambda p: f"\u0393 = {p.gamma}")]
+
+# 32 nodes per smooth piece of the integrand resolve the square root behaviour of xsi next to its kinks
+GAUSS_LEGENDRE_NODES, GAUSS_LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(32)
+
 
 
 class ApplicationWindow(QMainWindow):
@@ -45,8 +74,18 @@ class ApplicationWindow(QMainWindow):
         self.row_height = 20
         self.current_row = 0
 
-        self.num_cpus = mp.cpu_count()
-        self.pool = mp.Pool(self.num_cpus)
+        # parameters the canvas was last drawn with
+        self.canvas_params = None
+
+        # range grid of the canvas, rebuilt whenever r_range or n change
+        self.x_list = None
+        self.x_list_key = None
+
+        # coalesce bursts of slider events into a single redraw
+        self.redraw_delay = 50  # in ms
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.timeout.connect(self._update_canvas)
 
         hostname = socket.gethostname()
 
@@ -78,6 +117,28 @@ class ApplicationWindow(QMainWindow):
         self.addToolBar(NavigationToolbar(self.static_canvas, self))
 
         self._static_ax = self.static_canvas.figure.subplots()
+
+        # the lines are created once and only get new data on every redraw
+        linewidth = 2
+        self._hard_line, = self._static_ax.plot([], [], linestyle='solid', color='red', linewidth=linewidth)
+        self._soft_line, = self._static_ax.plot([], [], linestyle=(0, (1, 1)), color='blue', linewidth=linewidth)
+
+        # labels, grid, ticks and legend do not change between redraws, so they are only set up once
+        fontsize = 10
+        plt.rcParams["legend.fontsize"] = fontsize
+
+        self._static_ax.set_xlabel('range (m)', fontsize=fontsize)
+        self._static_ax.set_ylabel('received power (W)', fontsize=fontsize)
+        self._static_ax.grid(linestyle=(0, (1, 10)))
+
+        # change the fontsize of minor ticks label
+        self._static_ax.tick_params(axis='both', which='major', labelsize=fontsize)
+        self._static_ax.tick_params(axis='both', which='minor', labelsize=fontsize)
+
+        blue_patch =  mpatches.Patch(color='blue', label=r'$P_{R, fog}^{soft}$')
+        red_patch = mpatches.Patch(color='red', label=r'$P_{R, fog}^{hard}$')
+        self._static_ax.legend(handles=[blue_patch, red_patch])
+
         self.current_row += 1
 
         if self.p.linear_xsi:
@@ -90,245 +151,44 @@ class ApplicationWindow(QMainWindow):
 
         self.reset_btn = QPushButton(text="reset values")
         self.reset_btn.clicked.connect(self.toggle_reset)
-        self.reset_btn.setToolTip("resets one value at a time (from top to bottom)")
         self.layout.addWidget(self.reset_btn, self.current_row, 2, 1, 1)
 
         self.current_row += 1
 
-        self.r_title = QLabel('range')
-        self.r_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.r_title, self.current_row, 0)
-
-        self.r_slider = QSlider(Qt.Horizontal)
-        self.r_slider.setMinimum(self.p.r_range_min)
-        self.r_slider.setMaximum(self.p.r_range_max)
-        self.r_slider.setValue(self.p.r_range)
-
-        self.layout.addWidget(self.r_slider, self.current_row, 1)
-        self.r_slider.valueChanged.connect(self.update_labels)
-
-        self.r_label = QLabel(f"r = {self.p.r_range}")
-        self.r_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.r_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.n_title = QLabel('quantization')
-        self.n_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.n_title, self.current_row, 0)
-
-        self.n_slider = QSlider(Qt.Horizontal)
-        self.n_slider.setMinimum(self.p.n_min)
-        self.n_slider.setMaximum(self.p.n_max)
-        self.n_slider.setValue(self.p.n)
-
-        self.layout.addWidget(self.n_slider, self.current_row, 1)
-        self.n_slider.valueChanged.connect(self.update_labels)
-
-        self.n_label = QLabel(f"n = {self.p.n}")
-        self.n_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.n_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.mor_label = QLabel(f'meteorological optical range (MOR) = {round(self.p.mor, 2)}m')
-        self.mor_label.setAlignment(Qt.AlignCenter)
-        self.mor_label.setMaximumSize(self.monitor.width(), self.row_height)
-        self.layout.addWidget(self.mor_label, self.current_row, 0, 1, 3)
-        self.current_row += 1
-
-        self.alpha_title = QLabel('attenuation coefficient')
-        self.alpha_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.alpha_title, self.current_row, 0)
-
-        self.alpha_slider = QSlider(Qt.Horizontal)
-        self.alpha_slider.setMinimum(int(self.p.alpha_min * self.p.alpha_scale))
-        self.alpha_slider.setMaximum(int(self.p.alpha_max * self.p.alpha_scale))
-        self.alpha_slider.setValue(int(self.p.alpha * self.p.alpha_scale))
-
-        self.layout.addWidget(self.alpha_slider, self.current_row, 1)
-        self.alpha_slider.valueChanged.connect(self.update_labels)
-
-        self.alpha_label = QLabel(f"\u03B1 = {self.p.alpha}")
-        self.alpha_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.alpha_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.beta_title = QLabel('backscattering coefficient')
-        self.beta_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.beta_title, self.current_row, 0)
-
-        self.beta_slider = QSlider(Qt.Horizontal)
-        self.beta_slider.setMinimum(int(self.p.beta_min * self.p.beta_scale))
-        self.beta_slider.setMaximum(int(self.p.beta_max * self.p.beta_scale))
-        self.beta_slider.setValue(int(self.p.beta * self.p.beta_scale))
-
-        self.layout.addWidget(self.beta_slider, self.current_row, 1)
-        self.beta_slider.valueChanged.connect(self.update_labels)
-
-        self.beta_label = QLabel(f"\u03B2 = {round(self.p.beta * self.p.mor, 3)} / MOR")
-        self.beta_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.beta_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.e_p_label = QLabel(f'total pulse energy (E\N{LATIN SUBSCRIPT SMALL LETTER P}) = {round(self.p.e_p * 1e6, 1)} \u03BCJ')
-        self.e_p_label.setAlignment(Qt.AlignCenter)
-        self.e_p_label.setMaximumSize(self.monitor.width(), self.row_height)
-        self.layout.addWidget(self.e_p_label, self.current_row, 0, 1, 3)
-        self.current_row += 1
-
-        self.p_0_title = QLabel('pulse peak power')
-        self.p_0_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.p_0_title, self.current_row, 0)
-
-        self.p_0_slider = QSlider(Qt.Horizontal)
-        self.p_0_slider.setMinimum(int(self.p.p_0_min))
-        self.p_0_slider.setMaximum(int(self.p.p_0_max))
-        self.p_0_slider.setValue(int(self.p.p_0))
-
-        self.layout.addWidget(self.p_0_slider, self.current_row, 1)
-        self.p_0_slider.valueChanged.connect(self.update_labels)
-
-        self.p_0_label = QLabel('P0'.translate(SUB) + f" = {self.p.p_0} W")
-        self.p_0_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.p_0_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.tau_h_title = QLabel('half-power pulse width')
-        self.tau_h_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.tau_h_title, self.current_row, 0)
-
-        self.tau_h_slider = QSlider(Qt.Horizontal)
-        self.tau_h_slider.setMinimum(int(self.p.tau_h_min * self.p.tau_h_scale))
-        self.tau_h_slider.setMaximum(int(self.p.tau_h_max * self.p.tau_h_scale))
-        self.tau_h_slider.setValue(int(self.p.tau_h * self.p.tau_h_scale))
-
-        self.layout.addWidget(self.tau_h_slider, self.current_row, 1)
-        self.tau_h_slider.valueChanged.connect(self.update_labels)
-
-        self.tau_h_label = QLabel(f"{TAU_H} = {int(self.p.tau_h * self.p.tau_h_scale)} ns")
-        self.tau_h_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.tau_h_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.c_a_label = QLabel(f'system constant (C\N{LATIN SUBSCRIPT SMALL LETTER A}) = {round(self.p.c_a)}')
-        self.c_a_label.setAlignment(Qt.AlignCenter)
-        self.c_a_label.setMaximumSize(self.monitor.width(), self.row_height)
-        self.layout.addWidget(self.c_a_label, self.current_row, 0, 1, 3)
-        self.current_row += 1
-
-        self.a_r_title = QLabel('aperture area of the receiver')
-        self.a_r_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.a_r_title, self.current_row, 0)
-
-        self.a_r_slider = QSlider(Qt.Horizontal)
-        self.a_r_slider.setMinimum(int(self.p.a_r_min * self.p.a_r_scale))
-        self.a_r_slider.setMaximum(int(self.p.a_r_max * self.p.a_r_scale))
-        self.a_r_slider.setValue(int(self.p.a_r * self.p.a_r_scale))
-
-        self.layout.addWidget(self.a_r_slider, self.current_row, 1)
-        self.a_r_slider.valueChanged.connect(self.update_labels)
-
-        self.a_r_label = QLabel(f"A\N{LATIN SUBSCRIPT SMALL LETTER R} = {self.p.a_r} m²")
-        self.a_r_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.a_r_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.l_r_title = QLabel("loss of the receiver's optics")
-        self.l_r_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.l_r_title, self.current_row, 0)
+        for name, title, parameter, text in ROW_SPECS:
 
-        self.l_r_slider = QSlider(Qt.Horizontal)
-        self.l_r_slider.setMinimum(int(self.p.l_r_min * self.p.l_r_scale))
-        self.l_r_slider.setMaximum(int(self.p.l_r_max * self.p.l_r_scale))
-        self.l_r_slider.setValue(int(self.p.l_r * self.p.l_r_scale))
+            if parameter is None:
 
-        self.layout.addWidget(self.l_r_slider, self.current_row, 1)
-        self.l_r_slider.valueChanged.connect(self.update_labels)
+                label = QLabel(text(self.p))
+                label.setAlignment(Qt.AlignCenter)
+                label.setMaximumSize(self.monitor.width(), self.row_height)
+                self.layout.addWidget(label, self.current_row, 0, 1, 3)
+                setattr(self, f'{name}_label', label)
 
-        self.l_r_label = QLabel(f"L\N{LATIN SUBSCRIPT SMALL LETTER R} = {int(self.p.l_r * self.p.l_r_scale)} %")
-        self.l_r_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.l_r_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.optics_label = QLabel(f'sensor optics')
-        self.optics_label.setAlignment(Qt.AlignCenter)
-        self.optics_label.setMaximumSize(self.monitor.width(), self.row_height)
-        self.layout.addWidget(self.optics_label, self.current_row, 0, 1, 3)
-        self.current_row += 1
+            else:
 
-        self.r_1_title = QLabel("")
-        self.r_1_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.r_1_title, self.current_row, 0)
+                scale = getattr(self.p, f'{parameter}_scale', 1)
 
-        self.r_1_slider = QSlider(Qt.Horizontal)
-        self.r_1_slider.setMinimum(int(self.p.r_1_min * self.p.r_1_scale))
-        self.r_1_slider.setMaximum(int(self.p.r_1_max * self.p.r_1_scale))
-        self.r_1_slider.setValue(int(self.p.r_1 * self.p.r_1_scale))
-
-        self.layout.addWidget(self.r_1_slider, self.current_row, 1)
-        self.r_1_slider.valueChanged.connect(self.update_labels)
-
-        self.r_1_label = QLabel('R1'.translate(SUB) + f" = {self.p.r_1} m")
-        self.r_1_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.r_1_label, self.current_row, 2)
-        self.current_row += 1
+                title_label = QLabel(title)
+                title_label.setAlignment(Qt.AlignRight)
+                self.layout.addWidget(title_label, self.current_row, 0)
+                setattr(self, f'{name}_title', title_label)
 
-        self.r_2_title = QLabel("")
-        self.r_2_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.r_2_title, self.current_row, 0)
+                slider = QSlider(Qt.Horizontal)
+                slider.setMinimum(int(getattr(self.p, f'{parameter}_min') * scale))
+                slider.setMaximum(int(getattr(self.p, f'{parameter}_max') * scale))
+                slider.setValue(int(getattr(self.p, parameter) * scale))
 
-        self.r_2_slider = QSlider(Qt.Horizontal)
-        self.r_2_slider.setMinimum(int(self.p.r_2_min * self.p.r_2_scale))
-        self.r_2_slider.setMaximum(int(self.p.r_2_max * self.p.r_2_scale))
-        self.r_2_slider.setValue(int(self.p.r_2 * self.p.r_2_scale))
-
-        self.layout.addWidget(self.r_2_slider, self.current_row, 1)
-        self.r_2_slider.valueChanged.connect(self.update_labels)
-
-        self.r_2_label = QLabel('R2'.translate(SUB) + f" = {self.p.r_2} m")
-        self.r_2_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.r_2_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.beta_0_label = QLabel(f'differential reflextivity of the hard target (\u03B2' + '0)'.translate(SUB) +
-                                   f' = {round(self.p.beta_0, 5)}')
-        self.beta_0_label.setAlignment(Qt.AlignCenter)
-        self.beta_0_label.setMaximumSize(self.monitor.width(), self.row_height)
-        self.layout.addWidget(self.beta_0_label, self.current_row, 0, 1, 3)
-        self.current_row += 1
+                self.layout.addWidget(slider, self.current_row, 1)
+                slider.valueChanged.connect(self.update_labels)
+                setattr(self, f'{name}_slider', slider)
 
-        self.r_0_title = QLabel("distance to the hard target")
-        self.r_0_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.r_0_title, self.current_row, 0)
+                label = QLabel(text(self.p))
+                label.setAlignment(Qt.AlignLeft)
+                self.layout.addWidget(label, self.current_row, 2)
+                setattr(self, f'{name}_label', label)
 
-        self.r_0_slider = QSlider(Qt.Horizontal)
-        self.r_0_slider.setMinimum(self.p.r_0_min)
-        self.r_0_slider.setMaximum(self.p.r_0_max)
-        self.r_0_slider.setValue(self.p.r_0)
-
-        self.layout.addWidget(self.r_0_slider, self.current_row, 1)
-        self.r_0_slider.valueChanged.connect(self.update_labels)
-
-        self.r_0_label = QLabel('R0'.translate(SUB) + f" = {self.p.r_0} m")
-        self.r_0_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.r_0_label, self.current_row, 2)
-        self.current_row += 1
-
-        self.gamma_title = QLabel("reflextivity of the hard target")
-        self.gamma_title.setAlignment(Qt.AlignRight)
-        self.layout.addWidget(self.gamma_title, self.current_row, 0)
-
-        self.gamma_slider = QSlider(Qt.Horizontal)
-        self.gamma_slider.setMinimum(int(self.p.gamma_min * self.p.gamma_scale))
-        self.gamma_slider.setMaximum(int(self.p.gamma_max * self.p.gamma_scale))
-        self.gamma_slider.setValue(int(self.p.gamma * self.p.gamma_scale))
-
-        self.layout.addWidget(self.gamma_slider, self.current_row, 1)
-        self.gamma_slider.valueChanged.connect(self.update_labels)
-
-        self.gamma_label = QLabel(f"\u0393 = {self.p.gamma}")
-        self.gamma_label.setAlignment(Qt.AlignLeft)
-        self.layout.addWidget(self.gamma_label, self.current_row, 2)
-        self.current_row += 1
+            self.current_row += 1
 
         self._update_canvas()
 
@@ -345,22 +205,22 @@ class ApplicationWindow(QMainWindow):
         self._update_canvas()
 
 
-    def toggle_reset(self) -> None: # only resets one value at a time
+    def toggle_reset(self) -> None:
 
         self.p = ParameterSet()
 
-        self.r_slider.setValue(self.p.r_range)
-        self.n_slider.setValue(self.p.n)
-        self.alpha_slider.setValue(int(self.p.alpha * self.p.alpha_scale))
-        self.beta_slider.setValue(int(self.p.beta * self.p.beta_scale))
-        self.p_0_slider.setValue(self.p.p_0)
-        self.tau_h_slider.setValue(int(self.p.tau_h * self.p.tau_h_scale))
-        self.a_r_slider.setValue(int(self.p.a_r * self.p.a_r_scale))
-        self.l_r_slider.setValue(int(self.p.l_r * self.p.l_r_scale))
-        self.r_1_slider.setValue(int(self.p.r_1 * self.p.r_1_scale))
-        self.r_2_slider.setValue(int(self.p.r_2 * self.p.r_2_scale))
-        self.r_0_slider.setValue(self.p.r_0)
-        self.gamma_slider.setValue(int(self.p.gamma * self.p.gamma_scale))
+        for name, title, parameter, text in ROW_SPECS:
+
+            if parameter is not None:
+
+                scale = getattr(self.p, f'{parameter}_scale', 1)
+                slider = getattr(self, f'{name}_slider')
+
+                # otherwise every setValue() would call update_labels(),
+                # which reads the not yet reset sliders back into self.p
+                slider.blockSignals(True)
+                slider.setValue(int(getattr(self.p, parameter) * scale))
+                slider.blockSignals(False)
 
         self.update_labels()
 
@@ -368,288 +228,154 @@ class ApplicationWindow(QMainWindow):
     def update_labels(self) -> None:
 
         self.p.r_range = self.r_slider.value()
-        self.r_label.setText(f"r = {self.p.r_range}")
-
         self.p.n = self.n_slider.value()
-        self.n_label.setText(f"n = {self.p.n}")
 
         self.p.alpha = self.alpha_slider.value() / self.p.alpha_scale
-        self.alpha_label.setText(f"\u03B1 = {self.p.alpha}")
-
         self.p.mor = np.log(20) / self.p.alpha
-        self.mor_label.setText(f'meteorological optical range (MOR) = {round(self.p.mor, 2)}m')
 
         self.p.beta_scale = 1000 * self.p.mor
         self.p.beta = self.beta_slider.value() / self.p.beta_scale
-        self.beta_label.setText(f"\u03B2 = {round(self.p.beta * self.p.mor, 3)} / MOR")
 
         self.p.p_0 = self.p_0_slider.value()
-        self.p_0_label.setText('P0'.translate(SUB) + f" = {self.p.p_0} W")
-
         self.p.tau_h = self.tau_h_slider.value() / self.p.tau_h_scale
-        self.tau_h_label.setText(f"{TAU_H} = {int(self.p.tau_h * self.p.tau_h_scale)} ns")
-
         self.p.e_p = self.p.p_0 * self.p.tau_h
-        self.e_p_label.setText(f'total pulse energy (E\N{LATIN SUBSCRIPT SMALL LETTER P}) = {round(self.p.e_p * 1e6, 1)} \u03BCJ')
 
         self.p.a_r = self.a_r_slider.value() / self.p.a_r_scale
-        self.a_r_label.setText(f"A\N{LATIN SUBSCRIPT SMALL LETTER R} = {self.p.a_r} m²")
-
         self.p.l_r = self.l_r_slider.value() / self.p.l_r_scale
-        self.l_r_label.setText(f"L\N{LATIN SUBSCRIPT SMALL LETTER R} = {int(self.p.l_r * self.p.l_r_scale)} %")
-
         self.p.c_a = c * self.p.l_r * self.p.a_r / 2
-        self.c_a_label.setText(f'system constant (C\N{LATIN SUBSCRIPT SMALL LETTER A}) = {round(self.p.c_a)}')
 
         self.p.r_1 = self.r_1_slider.value() / self.p.r_1_scale
-        self.r_1_label.setText('R1'.translate(SUB) + f" = {self.p.r_1} m")
 
         self.p.r_2_min = self.p.r_1
         self.p.r_2 = self.r_2_slider.value() / self.p.r_2_scale
         if self.p.r_2 < self.p.r_1:
             self.p.r_2 = self.p.r_1
             self.r_2_slider.setValue(int(self.p.r_2 * self.p.r_2_scale))
-        self.r_2_label.setText('R2'.translate(SUB) + f" = {self.p.r_2} m")
 
         self.p.r_0 = self.r_0_slider.value()
-        self.r_0_label.setText('R0'.translate(SUB) + f" = {self.p.r_0} m")
 
         self.p.gamma = self.gamma_slider.value() / self.p.gamma_scale
-        self.gamma_label.setText(f"\u0393 = {self.p.gamma}")
-
         self.p.beta_0 = self.p.gamma / np.pi
-        self.beta_0_label.setText(f'differential reflextivity of the hard target (\u03B2' + '0)'.translate(SUB) +
-                                  f' = {round(self.p.beta_0, 5)}')
-
-        self._update_canvas()
-
 
-    def _update_canvas(self) -> None:
-
-        linewidth = 2
-        fontsize = 10
-
-        plt.rcParams["legend.fontsize"] = fontsize
-
-        self._static_ax.clear()
-        self._static_ax.set_xlabel('range (m)', fontsize=fontsize)
-        self._static_ax.set_ylabel('received power (W)', fontsize=fontsize)
-        self._static_ax.grid(linestyle=(0, (1, 10)))
+        for name, title, parameter, text in ROW_SPECS:
+            getattr(self, f'{name}_label').setText(text(self.p))
 
-        # change the fontsize of minor ticks label
-        self._static_ax.tick_params(axis='both', which='major', labelsize=fontsize)
-        self._static_ax.tick_params(axis='both', which='minor', labelsize=fontsize)
+        self.redraw_timer.start(self.redraw_delay)
 
-        ################
-        # P_R_fog_hard #
-        ################
 
-        x_list = np.linspace(0, self.p.r_range, self.p.n)
-        y_list = self.pool.map(functools.partial(P_R_fog_hard, self.p), x_list)
+    def _update_canvas(self) -> None:
 
-        # shift x so that the peak of the transmitted pulse is at t=0
-        # and the peak response of the hard target is at R_0
-        x_list = x_list - self.p.tau_h * c / 2
+        canvas_params = tuple(vars(self.p).items())
 
-        self._static_ax.plot(x_list, y_list, linestyle='solid', color='red', linewidth=linewidth)
+        if canvas_params == self.canvas_params:  # nothing changed since the last redraw
+            return
 
-        ################
-        # P_R_fog_soft #
-        ################
+        self.canvas_params = canvas_params
 
-        x_list = np.linspace(0, self.p.r_range, self.p.n)
-        y_list = self.pool.map(functools.partial(P_R_fog_soft, self.p), x_list)
+        # the range grid only depends on the range and the quantization
+        if self.x_list_key != (self.p.r_range, self.p.n):
+            self.x_list_key = (self.p.r_range, self.p.n)
+            # single precision is plenty for plotting (about 1e-6 of the peak), except for a strongly attenuated
+            # hard target: its response turns subnormal below 1e-38 and underflows to 0 below 1e-45 (e.g. alpha = 0.5
+            # at R_0 = 100 m), which is visible after switching to a log scale in the toolbar
+            self.x_list = np.linspace(0, self.p.r_range, self.p.n, dtype=np.float32)
 
         # shift x so that the peak of the transmitted pulse is at t=0
         # and the peak response of the hard target is at R_0
-        x_list = x_list - self.p.tau_h * c / 2
+        shifted_x_list = self.x_list - self.p.tau_h * c / 2
 
-        self._static_ax.plot(x_list, y_list, linestyle=(0, (1, 1)), color='blue', linewidth=linewidth)
-
-        ##########
-        # legend #
-        ##########
-
-        blue_patch =  mpatches.Patch(color='blue', label=r'$P_{R, fog}^{soft}$')
-        red_patch = mpatches.Patch(color='red', label=r'$P_{R, fog}^{hard}$')
-        self._static_ax.legend(handles=[blue_patch, red_patch])
+        #################################
+        # P_R_fog_hard and P_R_fog_soft #
+        #################################
 
-        self._static_ax.figure.canvas.draw()
+        y_hard, y_soft = P_R_fog_both(self.p, self.x_list)
 
+        self._hard_line.set_data(shifted_x_list, y_hard)
+        self._soft_line.set_data(shifted_x_list, y_soft)
 
-def r_T(p: ParameterSet, R: float = None) -> float:
+        # clear() used to turn autoscaling back on after zooming or panning with the toolbar, keep doing that
+        self._static_ax.relim()
+        self._static_ax.autoscale(True)
+        self._static_ax.autoscale_view()
 
-    if R is None:
-        R = p.r_0
+        self._static_ax.figure.canvas.draw_idle()
 
-    return R * np.tan(p.GAMMA_T / 2) + p.ROH_T
 
+def params_tuple(p: ParameterSet) -> Params:
 
-def r_R(p: ParameterSet, R: float = None) -> float:
+    # r_0 is an integer when set by its slider, cast it so the kernels are only compiled once
+    return Params(alpha=p.alpha, tau_h=p.tau_h, r_0=float(p.r_0), r_1=p.r_1, r_2=p.r_2, D=p.D,
+                  TAN_HALF_GAMMA_T=p.TAN_HALF_GAMMA_T, TAN_HALF_GAMMA_R=p.TAN_HALF_GAMMA_R,
+                  ROH_T=p.ROH_T, ROH_R=p.ROH_R, linear_xsi=p.linear_xsi)
 
-    if R is None:
-        R = p.r_0
-
-    return R * np.tan(p.GAMMA_R / 2) + p.ROH_R
-
-
-def phi_T(p: ParameterSet, R: float = None) -> float:
-
-    if R is None:
-        R = p.r_0
-
-    x = ((r_T(p, R) ** 2) - (r_R(p, R) ** 2) + (p.D ** 2)) / (2 * p.D * r_T(p, R))
-
-    if x < 1:
-
-        if x > -1:
-
-            y = np.arccos(x)
-
-        else:
 
-            y = np.pi
+def float_array(R: np.ndarray) -> np.ndarray:
 
-    else:
+    # single precision input (e.g. the range grid of the canvas) stays single precision, anything else becomes double
+    R = np.asarray(R)
 
-        y = 0
+    return R if R.dtype == np.float32 else R.astype(np.float64, copy=False)
 
-    return 2 * y
 
+def P_R_clear_hard(p: ParameterSet, R: np.ndarray, params: Params = None) -> np.ndarray:
 
-def phi_R(p: ParameterSet, R: float = None) -> float:
+    if params is None:
+        params = params_tuple(p)
 
-    if R is None:
-        R = p.r_0
+    R = float_array(R)
 
-    x = ((r_R(p, R) ** 2) - (r_T(p, R) ** 2) + (p.D ** 2)) / (2 * p.D * r_R(p, R))
+    arr = np.zeros(R.shape, dtype=R.dtype)
 
-    if x < 1:
+    # the hard target only responds within one pulse length behind R_0 => evaluate the sine there only
+    mask = (p.r_0 <= R) & (R <= (p.r_0 + c * p.tau_h))
 
-        if x > -1:
+    xsi_0 = xsi(params.r_0, params.r_1, params.r_2, params.D, params.TAN_HALF_GAMMA_T, params.TAN_HALF_GAMMA_R,
+                params.ROH_T, params.ROH_R, params.linear_xsi)
 
-            y = np.arccos(x)
-
-        else:
-
-            y = np.pi
-
-    else:
-
-        y = 0
-
-    return 2 * y
-
-
-def xsi(p: ParameterSet, R: float = None) -> float:
-
-    if R is None:
-        R = p.r_0
-
-    if R <= p.r_1:  # emitted ligth beam from the tansmitter is not captured by the receiver
-
-        return 0
-
-    elif R >= p.r_2:  # emitted ligth beam from the tansmitter is fully captured by the receiver
-
-        return 1
-
-    else:  # emitted ligth beam from the tansmitter is partly captured by the receiver
-
-        if p.linear_xsi:  # use a linear interpolation
-
-            m = (1 - 0) / (p.r_2 - p.r_1)
-            b = 0 - (m * p.r_1)
-            y = m * R + b
-
-        else:
-
-            y = ((r_T(p, R) ** 2) * (phi_T(p, R) - np.sin(phi_T(p, R)))
-                 + (r_R(p, R) ** 2) * (phi_R(p, R) - np.sin(phi_R(p, R)))) / (2 * np.pi * (r_T(p, R) ** 2))
-
-        return y
-
-
-def xsi_loop(p: ParameterSet, R: np.ndarray) -> np.ndarray:
-
-    xsi_array = np.zeros(R.shape)
-
-    for j, r in enumerate(R):
-        xsi_array[j] = xsi(p, r)
-
-    return xsi_array
-
-
-def inverse_square_modified(p: ParameterSet, R: float, t: np.ndarray) -> np.ndarray:
-
-    arr = np.zeros(t.shape)
-
-    for j, t_star in enumerate(t):
-
-        if t_star >= 2 * (R - p.r_1) / c:  # to avoid infinity * 0
-
-            arr[j] = 0
-
-        else:
-
-            arr[j] = 1 / ((R - (c * t_star) / 2) ** 2)
+    arr[mask] = p.c_a * p.p_0 * (xsi_0 / (params.r_0 ** 2)) * p.beta_0 \
+                * (np.sin((np.pi * (R[mask] - p.r_0)) / (c * p.tau_h)) ** 2)
 
     return arr
 
 
-def P_R_clear_hard(p: ParameterSet, R: float) -> float:
-
-    if p.r_0 <= R <= (p.r_0 + c * p.tau_h):
-
-        return p.c_a * p.p_0 * (xsi(p) / (p.r_0 ** 2)) * p.beta_0 \
-               * (math.sin((np.pi * (R - p.r_0)) / (c * p.tau_h)) ** 2)
-
-    else:
-
-        return 0
-
-
-def P_R_clear(p: ParameterSet, R: float) -> float:
+def P_R_clear(p: ParameterSet, R: np.ndarray) -> np.ndarray:
 
     return P_R_clear_hard(p, R)
 
 
-def P_R_fog_hard(p: ParameterSet, R: float) -> float:
+def P_R_fog_hard(p: ParameterSet, R: np.ndarray, params: Params = None) -> np.ndarray:
+
+    return math.exp(-2 * p.alpha * p.r_0) * P_R_clear_hard(p, R, params)
 
-    return np.exp(-2 * p.alpha * p.r_0) * P_R_clear_hard(p, R)
 
+def P_R_fog_soft(p: ParameterSet, R: np.ndarray, params: Params = None) -> np.ndarray:
 
-def P_R_fog_soft(p, R: float, n: int = None) -> float:
+    if params is None:
+        params = params_tuple(p)
 
-    if n is None:
-        n = p.n
+    R = float_array(R)
 
-    def integrand(t: np.ndarray) -> np.ndarray:
-        arr = (np.sin(np.pi / (2 * p.tau_h) * t) ** 2) \
-              * (np.exp(-2 * p.alpha * (R - ((c * t) / 2)))) \
-              * inverse_square_modified(p, R, t) \
-              * xsi_loop(p, R - ((c * t) / 2)) \
-              * np.heaviside(p.r_0 - R + (c * t) / 2, 0)
+    # the kernel always integrates in double precision
+    y = integral(R.astype(np.float64, copy=False).ravel(), GAUSS_LEGENDRE_NODES, GAUSS_LEGENDRE_WEIGHTS,
+                 *params).reshape(R.shape)
 
-        return arr
+    return (p.c_a * p.p_0 * p.beta * y).astype(R.dtype)
 
-    start = 0
-    stop = 2 * p.tau_h
 
-    x = np.linspace(start, stop, n)
-    y = integrand(x)
+def P_R_fog_both(p: ParameterSet, R: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
 
-    integral = scipy_integrate.simps(y, x)
+    # share the conversion of the ranges and the kernel parameters between both responses
+    R = float_array(R)
+    params = params_tuple(p)
 
-    return p.c_a * p.p_0 * p.beta * integral
+    return P_R_fog_hard(p, R, params), P_R_fog_soft(p, R, params)
 
 
-def P_R_fog(p: ParameterSet, R: float, n: int = None) -> float:
+def P_R_fog(p: ParameterSet, R: np.ndarray) -> np.ndarray:
 
-    if n is None:
-        n = p.n
+    y_hard, y_soft = P_R_fog_both(p, R)
 
-    return P_R_fog_soft(p, R, n) + P_R_fog_hard(p, R)
+    return y_soft + y_hard
 
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+__author__  = "Martin Hahner"
+__contact__ = "martin.hahner@pm.me"
+__license__ = "CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)"
+
+# numerical kernels of theory.py
+# run this file once to compile xsi() and integral() ahead of time, otherwise they get (re)compiled just in time
+
+import os
+
+import numba
+import numpy as np
+
+from collections import namedtuple
+
+from scipy.constants import speed_of_light as c     # in m/s
+
+# numba can not handle a ParameterSet, so the kernels receive its values in the order of this namedtuple
+Params = namedtuple('Params', ['alpha', 'tau_h', 'r_0', 'r_1', 'r_2', 'D',
+                               'TAN_HALF_GAMMA_T', 'TAN_HALF_GAMMA_R', 'ROH_T', 'ROH_R', 'linear_xsi'])
+
+# signatures of the ahead-of-time compiled xsi() and integral()
+XSI_SIGNATURE = 'f8(f8, f8, f8, f8, f8, f8, f8, f8, b1)'
+INTEGRAL_SIGNATURE = 'f8[:](f8[:], f8[:], f8[:], f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, b1)'
+
+
+
+@numba.njit(cache=True, fastmath=True)
+def xsi(R: float, r_1: float, r_2: float, D: float, TAN_HALF_GAMMA_T: float, TAN_HALF_GAMMA_R: float,
+        ROH_T: float, ROH_R: float, linear_xsi: bool) -> float:
+
+    if R <= r_1:  # emitted ligth beam from the tansmitter is not captured by the receiver
+
+        return 0.0
+
+    elif R >= r_2:  # emitted ligth beam from the tansmitter is fully captured by the receiver
+
+        return 1.0
+
+    else:  # emitted ligth beam from the tansmitter is partly captured by the receiver
+
+        if linear_xsi:  # use a linear interpolation
+
+            return (R - r_1) / (r_2 - r_1)
+
+        r_t = R * TAN_HALF_GAMMA_T + ROH_T
+        r_r = R * TAN_HALF_GAMMA_R + ROH_R
+
+        x_t = ((r_t ** 2) - (r_r ** 2) + (D ** 2)) / (2 * D * r_t)
+        x_r = ((r_r ** 2) - (r_t ** 2) + (D ** 2)) / (2 * D * r_r)
+
+        # clipping covers the limit cases x >= 1 (=> 0) and x <= -1 (=> pi) without branching
+        phi_t = 2 * np.arccos(min(max(x_t, -1.0), 1.0))
+        phi_r = 2 * np.arccos(min(max(x_r, -1.0), 1.0))
+
+        return ((r_t ** 2) * (phi_t - np.sin(phi_t)) + (r_r ** 2) * (phi_r - np.sin(phi_r))) / (2 * np.pi * (r_t ** 2))
+
+
+@numba.njit(cache=True, fastmath=True)
+def soft_integrand(R: float, t: np.ndarray, alpha: float, tau_h: float, r_0: float, r_1: float, r_2: float,
+                   D: float, TAN_HALF_GAMMA_T: float, TAN_HALF_GAMMA_R: float, ROH_T: float, ROH_R: float,
+                   linear_xsi: bool) -> np.ndarray:
+
+    # inverse_square_modified, xsi and the heaviside step fused into a single pass over t
+
+    arr = np.zeros(t.shape[0])
+
+    for j in range(t.shape[0]):
+
+        r = R - (c * t[j]) / 2
+
+        if r >= r_0:  # heaviside => no fog behind the hard target
+
+            continue
+
+        if r <= r_1:  # emitted ligth beam is not captured by the receiver (also avoids infinity * 0)
+
+            continue
+
+        y = xsi(r, r_1, r_2, D, TAN_HALF_GAMMA_T, TAN_HALF_GAMMA_R, ROH_T, ROH_R, linear_xsi)
+
+        arr[j] = (np.sin(np.pi / (2 * tau_h) * t[j]) ** 2) * np.exp(-2 * alpha * r) / (r ** 2) * y
+
+    return arr
+
+
+@numba.njit(cache=True, fastmath=True, parallel=True)
+def integral(R: np.ndarray, x: np.ndarray, w: np.ndarray, alpha: float, tau_h: float, r_0: float, r_1: float,
+             r_2: float, D: float, TAN_HALF_GAMMA_T: float, TAN_HALF_GAMMA_R: float, ROH_T: float, ROH_R: float,
+             linear_xsi: bool) -> np.ndarray:
+
+    # x and w are the Gauss-Legendre nodes and weights on [-1, 1], the remaining arguments are the fields of Params
+
+    arr = np.zeros(R.shape[0])
+
+    # the formula xsi has two more kinks where the clipping in phi_T and phi_R starts and stops acting,
+    # at the ranges where the two beams start to overlap and where the transmitted beam is fully inside
+    # the receiver's FOV (in m, see Figure 2 and Equations (11) and (12) in [1])
+    if linear_xsi or TAN_HALF_GAMMA_R <= TAN_HALF_GAMMA_T:
+        r_a = r_b = np.inf
+    else:
+        r_a = (D - ROH_T - ROH_R) / (TAN_HALF_GAMMA_T + TAN_HALF_GAMMA_R)
+        r_b = (D - ROH_R + ROH_T) / (TAN_HALF_GAMMA_R - TAN_HALF_GAMMA_T)
+
+    for i in numba.prange(R.shape[0]):
+
+        # the integrand vanishes before the heaviside step and once the receiver stops seeing the beam
+        t_start = max(0.0, 2 * (R[i] - r_0) / c)
+        t_stop = min(2 * tau_h, 2 * (R[i] - r_1) / c)
+
+        # xsi is only piecewise smooth, so integrate between its kinks separately
+        bounds = np.empty(5)
+        bounds[0] = t_start
+        bounds[1] = min(max(2 * (R[i] - r_2) / c, t_start), t_stop)
+        bounds[2] = min(max(2 * (R[i] - r_a) / c, t_start), t_stop)
+        bounds[3] = min(max(2 * (R[i] - r_b) / c, t_start), t_stop)
+        bounds[4] = t_stop
+        bounds.sort()
+
+        for k in range(4):
+
+            a = bounds[k]
+            b = bounds[k + 1]
+
+            if b > a:
+
+                t = (b - a) / 2 * x + (a + b) / 2
+                y = soft_integrand(R[i], t, alpha, tau_h, r_0, r_1, r_2, D,
+                                   TAN_HALF_GAMMA_T, TAN_HALF_GAMMA_R, ROH_T, ROH_R, linear_xsi)
+
+                arr[i] += (b - a) / 2 * np.sum(w * y)
+
+    return arr
+
+
+if __name__ == "__main__":
+
+    from numba.pycc import CC
+
+    # pycc does not support parallel=True, so the ahead-of-time version runs on a single thread
+    cc = CC('theory_kernels_aot')
+    cc.output_dir = os.path.dirname(os.path.realpath(__file__))
+    cc.export('xsi', XSI_SIGNATURE)(xsi.py_func)
+    cc.export('integral', INTEGRAL_SIGNATURE)(integral.py_func)
+    cc.compile()